@@ -4,9 +4,13 @@ Cozmo protocol client and high-level API.
 
 """
 
-from threading import Event
+from threading import Event, Thread
+from queue import Queue, Empty, Full
+from collections import deque, namedtuple, OrderedDict
 from typing import Optional, Tuple
 import json
+import operator
+import logging
 import time
 import io
 
@@ -38,18 +42,49 @@ __all__ = [
 ]
 
 
+_JPEG_MINI_GRAY = protocol_encoder.ImageEncoding.JPEGMinimizedGray
+# Encodings with a single channel. Their images are reassembled into buffers of 1 byte per pixel instead of 3.
+# JPEGMinimizedGray also carries miniColor images, which are half width and fit as well.
+_GRAY_ENCODINGS = frozenset((
+    protocol_encoder.ImageEncoding.RawGray,
+    protocol_encoder.ImageEncoding.JPEGGray,
+    protocol_encoder.ImageEncoding.JPEGMinimizedGray,
+))
+# Robot status flags and their change events, in a form that is cheap to iterate on every RobotState packet.
+_STATUS_EVTS_TUPLE = tuple(event.STATUS_EVENTS.items())
+_STATUS_FLAG_NAMES = robot.RobotStatusFlagNames
+# Status flags, reported once head and lift motor calibration has completed.
+_CALIBRATED_STATUS = robot.RobotStatusFlag.HEAD_IN_POS | robot.RobotStatusFlag.LIFT_IN_POS
+# Raw robot state values from a single RobotState packet.
+_RawRobotState = namedtuple("_RawRobotState", (
+    "pose_x", "pose_y", "pose_z", "pose_angle_rad", "pose_origin_id", "pose_pitch_rad", "head_angle_rad",
+    "lwheel_speed_mmps", "rwheel_speed_mmps", "lift_height_mm",
+    "accel_x", "accel_y", "accel_z", "gyro_x", "gyro_y", "gyro_z"))
+# Reads the raw robot state values from a RobotState packet, in _RawRobotState field order.
+_get_raw_robot_state = operator.attrgetter(*_RawRobotState._fields)
+
+
 class Client(event.Dispatcher):
     """ Cozmo protocol client and high-level API class. """
 
+    # Maximum number of available objects to remember. The oldest ones are forgotten first.
+    MAX_AVAILABLE_OBJECTS = 256
+    # Time since SyncTime, in ms, after which the robot is considered ready, even if it does not report head and lift
+    # motor calibration as complete.
+    ROBOT_READY_TIMEOUT_MS = 500
+
     def __init__(self,
                  robot_addr: Optional[Tuple[str, int]] = None,
                  protocol_log_messages: Optional[list] = None,
                  auto_initialize: bool = True,
                  enable_animations: bool = True,
-                 enable_procedural_face: bool = True) -> None:
+                 enable_procedural_face: bool = True,
+                 fast_color_resize: bool = True) -> None:
         super().__init__()
         # Whether to automatically initialize the robot when connection is established.
         self.auto_initialize = bool(auto_initialize)
+        # Whether to stretch color camera images by pixel doubling instead of bilinear interpolation.
+        self.fast_color_resize = bool(fast_color_resize)
 
         self.conn = conn.Connection(robot_addr, protocol_log_messages)
         self.conn.add_child_dispatcher(self)
@@ -59,25 +94,31 @@ class Client(event.Dispatcher):
 
         self.serial_number_head = None
         self.robot_fw_sig = None
+        self.robot_fw_version = None
         self.serial_number = None
         self.body_hw_version = None
         self.body_color = None
         # Robot state
-        # Heading in X-Y plane.
         self.pose_frame_id = 0
-        self.pose = util.Pose(0.0, 0.0, 0.0, angle_z=util.Angle(radians=0.0), origin_id=1)
-        self.pose_pitch = util.Angle(radians=0.0)
-        self.head_angle = util.Angle(radians=robot.MIN_HEAD_ANGLE.radians)
-        self.left_wheel_speed = util.Speed(mmps=0.0)
-        self.right_wheel_speed = util.Speed(mmps=0.0)
-        self.lift_position = robot.LiftPosition(height=robot.MIN_LIFT_HEIGHT)
         self.battery_voltage = 0.0
-        self.accel = util.Vector3(0.0, 0.0, 0.0)
-        self.gyro = util.Vector3(0.0, 0.0, 0.0)
+        # Raw values from the last RobotState packet, replaced with a single assignment, so that readers on other
+        # threads always see values from the same packet.
+        self._raw_robot_state = _RawRobotState(
+            pose_x=0.0, pose_y=0.0, pose_z=0.0, pose_angle_rad=0.0, pose_origin_id=1, pose_pitch_rad=0.0,
+            head_angle_rad=robot.MIN_HEAD_ANGLE.radians, lwheel_speed_mmps=0.0, rwheel_speed_mmps=0.0,
+            lift_height_mm=robot.MIN_LIFT_HEIGHT.mm,
+            accel_x=0.0, accel_y=0.0, accel_z=0.0, gyro_x=0.0, gyro_y=0.0, gyro_z=0.0)
+        # Wrapper objects, built from the raw values above on first property access, together with the raw values
+        # they were built from.
+        self._robot_state_cache = (None, {})
         self.robot_status = 0
         self.robot_orientation = robot.RobotOrientation.ON_THREADS
         self.robot_picked_up = False
         self.robot_moving = False
+        # Whether initialization is waiting for motor calibration to complete.
+        self._robot_ready_pending = False
+        # Whether the robot has been initialized and EvtRobotReady has been dispatched.
+        self.robot_ready = False
         # Animation state
         self.num_anim_bytes_played = 0
         self.num_audio_frames_played = 0
@@ -86,8 +127,21 @@ class Client(event.Dispatcher):
         self.client_drop_count = 0
         # Camera state
         self.last_image_timestamp = None
+        # Pool of image reassembly buffers, grown on demand to the image resolution. Three buffers are enough for one
+        # image being received, one waiting to be decoded, and one being decoded.
+        self._free_image_bufs = deque(bytearray() for _ in range(3))
+        self._partial_buf = None
+        self._partial_mv = None
+        # Completed images, waiting to be decoded. Only the latest image is kept if decoding falls behind.
+        self._image_queue = Queue(maxsize=1)
+        self._image_thread = None
+        self.stop_flag = False
+        # Image thread scratch buffer for mini*ToJpeg conversion. Grown on demand.
+        self._jpeg_buf = np.empty(0, dtype=np.uint8)
+        # Image thread file object for JPEG decoding. Images must be fully loaded before it is reused.
+        self._jpeg_file = io.BytesIO()
         # Object state
-        self.available_objects = dict()
+        self.available_objects = OrderedDict()
         self.connected_objects = dict()
         # Filters
         self.packet_type_filter = filter.Filter()
@@ -114,11 +168,18 @@ class Client(event.Dispatcher):
         self.add_handler(protocol_encoder.DebugData, self._on_debug_data)
         self.add_handler(event.EvtRobotPickedUpChange, self._on_robot_picked_up)
         self.add_handler(event.EvtRobotWheelsMovingChange, self._on_robot_moving)
+        self.stop_flag = False
+        self._image_thread = Thread(daemon=True, name="ImageThread", target=self._image_thread_run)
+        self._image_thread.start()
         self.conn.start()
 
     def stop(self) -> None:
         logger.debug("Stopping client...")
         self.conn.stop()
+        self.stop_flag = True
+        if self._image_thread:
+            self._image_thread.join()
+            self._image_thread = None
         self.anim_controller.stop()
         self.del_all_handlers()
 
@@ -137,6 +198,9 @@ class Client(event.Dispatcher):
         self.conn.send(pkt)  # This repetition seems to trigger BodyInfo
 
     def _initialize_robot(self):
+        # No explicit batching is needed here - the send thread packs packets, queued within its collection
+        # interval, into a single frame and sends it with a single sendto() call.
+
         # Set world frame origin to (0,0,0), frame ID to 0, and origin ID to 1.
         pkt = protocol_encoder.SetOrigin()
         self.conn.send(pkt)
@@ -144,12 +208,9 @@ class Client(event.Dispatcher):
         pkt = protocol_encoder.SyncTime()
         self.conn.send(pkt)
 
-        # TODO: Proper waiting for motor calibration to complete.
-        time.sleep(0.5)
-
-        self.anim_controller.start()
-
-        self.dispatch(event.EvtRobotReady, self)
+        # The robot is considered ready once it reports head and lift motor calibration as complete, or
+        # ROBOT_READY_TIMEOUT_MS after SyncTime. See _on_robot_state().
+        self._robot_ready_pending = True
 
     def _on_hardware_info(self, cli, pkt: protocol_encoder.HardwareInfo):
         del cli
@@ -158,10 +219,11 @@ class Client(event.Dispatcher):
     def _on_firmware_signature(self, cli, pkt: protocol_encoder.FirmwareSignature):
         del cli
         self.robot_fw_sig = json.loads(pkt.signature)
-        logger.info("Firmware version %s.", self.robot_fw_sig["version"])
+        self.robot_fw_version = self.robot_fw_sig["version"]
+        logger.info("Firmware version %s.", self.robot_fw_version)
         if self.robot_fw_sig.get("build") == "FACTORY":
             logger.warning("Factory/recovery firmware detected. Functionality is degraded.")
-        elif self.robot_fw_sig["version"] < protocol_declaration.FIRMWARE_VERSION:
+        elif self.robot_fw_version < protocol_declaration.FIRMWARE_VERSION:
             logger.warning(
                 "Old firmware detected. PyCozmo works best with v{}. Functionality may be degraded.".format(
                     protocol_declaration.FIRMWARE_VERSION))
@@ -184,119 +246,200 @@ class Client(event.Dispatcher):
         if not e.wait(timeout):
             raise exception.Timeout("Timeout waiting for event {}".format(evt))
 
+    def _wait_for_state(self, evt, state, timeout: Optional[float] = None) -> None:
+        """ Wait for an event, unless state() indicates that it has already happened. """
+        e = Event()
+        # Register before checking the state, so that an event, dispatched in between, is not missed.
+        handler = self.add_handler(evt, lambda cli: e.set(), one_shot=True)
+        if state():
+            self.del_handler(evt, handler)
+            return
+        if not e.wait(timeout):
+            self.del_handler(evt, handler)
+            raise exception.Timeout("Timeout waiting for event {}".format(evt))
+
     def wait_for_robot(self, timeout: float = 5.0) -> None:
-        if not self.robot_fw_sig:
-            try:
-                self.wait_for(event.EvtRobotFound, timeout=timeout)
-            except exception.Timeout as e:
-                raise exception.ConnectionTimeout("Failed to connect to Cozmo.") from e
+        try:
+            self._wait_for_state(event.EvtRobotFound, lambda: self.serial_number is not None, timeout=timeout)
+        except exception.Timeout as e:
+            raise exception.ConnectionTimeout("Failed to connect to Cozmo.") from e
 
-        if not self.serial_number:
+        if self.auto_initialize:
             try:
-                self.wait_for(event.EvtRobotReady, timeout=timeout)
+                self._wait_for_state(event.EvtRobotReady, lambda: self.robot_ready, timeout=timeout)
             except exception.Timeout as e:
                 raise exception.ConnectionTimeout("Failed to initialize Cozmo.") from e
 
     def _reset_partial_state(self):
+        if self._partial_buf is not None:
+            self._free_image_bufs.append(self._partial_buf)
+            self._partial_buf = None
+            self._partial_mv = None
         self._partial_image_timestamp = None
-        self._partial_data = None
         self._partial_image_id = None
         self._partial_invalid = False
         self._partial_size = 0
         self._partial_image_encoding = None
         self._partial_image_resolution = None
+        self._partial_wh = None
         self._last_chunk_id = -1
 
     def _on_image_chunk(self, cli, pkt: protocol_encoder.ImageChunk):
         del cli
-        if self._partial_image_id is not None and pkt.chunk_id == 0:
-            if not self._partial_invalid:
+        chunk_id = pkt.chunk_id
+        if chunk_id == 0:
+            if self._partial_image_id is not None:
                 logger.debug("Lost final chunk of image - discarding.")
-            self._partial_image_id = None
-
-        if self._partial_image_id is None:
-            if pkt.chunk_id != 0:
-                if not self._partial_invalid:
-                    logger.debug("Received chunk of broken image.")
-                self._partial_invalid = True
+            if not self._start_image(pkt):
                 return
-            # Discard any previous in-progress image
-            self._reset_partial_state()
-            self._partial_image_timestamp = pkt.frame_timestamp
-            self._partial_image_id = pkt.image_id
-            self._partial_image_encoding = protocol_encoder.ImageEncoding(pkt.image_encoding)
-            self._partial_image_resolution = protocol_encoder.ImageResolution(pkt.image_resolution)
-
-            image_resolution = protocol_encoder.ImageResolution(pkt.image_resolution)
-            width, height = camera.RESOLUTIONS[image_resolution]
-            max_size = width * height * 3  # 3 bytes per pixel (RGB)
-            self._partial_data = np.empty(max_size, dtype=np.uint8)
-
-        if pkt.chunk_id != (self._last_chunk_id + 1) or pkt.image_id != self._partial_image_id:
-            logger.debug("Image missing chunks - discarding (last_chunk_id=%d partial_image_id=%s).",
-                         self._last_chunk_id, self._partial_image_id)
+        elif self._partial_image_id is None or chunk_id != self._last_chunk_id + 1 \
+                or pkt.image_id != self._partial_image_id:
+            if logger.isEnabledFor(logging.DEBUG):
+                if self._partial_image_id is not None:
+                    logger.debug("Image missing chunks - discarding (last_chunk_id=%d partial_image_id=%s).",
+                                 self._last_chunk_id, self._partial_image_id)
+                elif not self._partial_invalid:
+                    logger.debug("Received chunk of broken image.")
             self._reset_partial_state()
             self._partial_invalid = True
             return
 
+        data = pkt.data
         offset = self._partial_size
-        self._partial_data[offset:offset + len(pkt.data)] = np.frombuffer(pkt.data, dtype=np.uint8)
-        self._partial_size += len(pkt.data)
-        self._last_chunk_id = pkt.chunk_id
+        end = offset + len(data)
+        if end > len(self._partial_mv):
+            logger.debug("Image larger than expected - discarding.")
+            self._reset_partial_state()
+            self._partial_invalid = True
+            return
+        self._partial_mv[offset:end] = data
+        self._partial_size = end
+        self._last_chunk_id = chunk_id
 
-        if pkt.chunk_id == pkt.image_chunk_count - 1:
-            self._process_completed_image()
+        if chunk_id == pkt.image_chunk_count - 1:
+            self._post_completed_image()
             self._reset_partial_state()
 
-    def _process_completed_image(self):
-        data = self._partial_data[0:self._partial_size]
+    def _start_image(self, pkt: protocol_encoder.ImageChunk) -> bool:
+        """ Start receiving a new image, discarding any previous in-progress image. """
+        self._reset_partial_state()
+        try:
+            buf = self._free_image_bufs.popleft()
+        except IndexError:
+            logger.error("No free image buffer - discarding image.")
+            self._partial_invalid = True
+            return False
+        self._partial_image_timestamp = pkt.frame_timestamp
+        self._partial_image_id = pkt.image_id
+        self._partial_image_encoding = protocol_encoder.ImageEncoding(pkt.image_encoding)
+        self._partial_image_resolution = protocol_encoder.ImageResolution(pkt.image_resolution)
+        self._partial_wh = camera.RESOLUTIONS[self._partial_image_resolution]
+        width, height = self._partial_wh
+        # 1 byte per pixel for grayscale and 3 bytes per pixel (RGB) for color images.
+        max_size = width * height * (1 if self._partial_image_encoding in _GRAY_ENCODINGS else 3)
+        if len(buf) < max_size:
+            buf = bytearray(max_size)
+        self._partial_buf = buf
+        self._partial_mv = memoryview(buf)
+        return True
+
+    def _post_completed_image(self):
+        """ Hand a completed image over to the image thread for decoding, dropping any older pending image. """
+        item = (self._partial_buf, self._partial_size, self._partial_image_encoding,
+                self._partial_wh, self._partial_image_timestamp)
+        # The buffer is now owned by the image thread.
+        self._partial_buf = None
+        self._partial_mv = None
+        try:
+            self._image_queue.put_nowait(item)
+        except Full:
+            try:
+                dropped = self._image_queue.get_nowait()
+                self._free_image_bufs.append(dropped[0])
+                logger.debug("Image decoding is falling behind - dropping image.")
+            except Empty:
+                pass
+            self._image_queue.put_nowait(item)
+
+    def _image_thread_run(self):
+        """ Image thread loop. Completed image decoding and dispatching. """
+        while not self.stop_flag:
+            try:
+                item = self._image_queue.get(timeout=0.05)
+            except Empty:
+                continue
+            except Exception as e:
+                logger.error("Failed to get from image queue. {}".format(e))
+                continue
+
+            buf, data_size, image_encoding, size, timestamp = item
+            try:
+                self._process_completed_image(memoryview(buf)[:data_size], image_encoding, size, timestamp)
+            except Exception as e:
+                logger.error("Failed to process camera image. {}".format(e))
+            finally:
+                self._free_image_bufs.append(buf)
 
+    def _process_completed_image(self, data, image_encoding, size, timestamp):
         # The first byte of the image is whether or not it is in color
         is_color_image = data[0] != 0
 
-        if self._partial_image_encoding == protocol_encoder.ImageEncoding.JPEGMinimizedGray:
-            width, height = camera.RESOLUTIONS[self._partial_image_resolution]
+        if image_encoding == _JPEG_MINI_GRAY:
+            width, height = size
+
+            # Worst case is every byte being stuffed, plus the JPEG header.
+            max_size = 2 * len(data) + 1024
+            if len(self._jpeg_buf) < max_size:
+                self._jpeg_buf = np.empty(max_size, dtype=np.uint8)
 
             if is_color_image:
                 # Color images are half width
                 width = width // 2
-                data = camera.minicolor_to_jpeg(data, width, height)
+                data = camera.minicolor_to_jpeg(data, width, height, out=self._jpeg_buf)
             else:
-                data = camera.minigray_to_jpeg(data, width, height)
+                data = camera.minigray_to_jpeg(data, width, height, out=self._jpeg_buf)
 
-        image = Image.open(io.BytesIO(data)).convert('RGB')
+        f = self._jpeg_file
+        f.seek(0)
+        f.truncate()
+        f.write(data)
+        f.seek(0)
+        image = Image.open(f)
 
-        # Color images need to be resized to the proper resolution
         if is_color_image:
-            size = camera.RESOLUTIONS[self._partial_image_resolution]
-            image = image.resize(size)
+            # Color images are half width and need to be stretched horizontally to the proper resolution.
+            if image.mode != 'RGB':
+                image = image.convert('RGB')
+            resample = Image.NEAREST if self.fast_color_resize else Image.BILINEAR
+            image = image.resize(size, resample)
+        else:
+            # Grayscale images are delivered in their native single-channel "L" mode.
+            image.load()
 
         self._latest_image = image
-        self.last_image_timestamp = self._partial_image_timestamp
+        self.last_image_timestamp = timestamp
         self.dispatch(event.EvtNewRawCameraImage, self, image)
 
     def _on_robot_state(self, cli, pkt: protocol_encoder.RobotState):
         del cli
         self.pose_frame_id = pkt.pose_frame_id
-        self.pose = util.Pose(pkt.pose_x, pkt.pose_y, pkt.pose_z,
-                              angle_z=util.Angle(radians=pkt.pose_angle_rad), origin_id=pkt.pose_origin_id)
-        self.pose_pitch = util.Angle(radians=pkt.pose_pitch_rad)
-        self.head_angle = util.Angle(radians=pkt.head_angle_rad)
-        self.left_wheel_speed = util.Speed(mmps=pkt.lwheel_speed_mmps)
-        self.right_wheel_speed = util.Speed(mmps=pkt.rwheel_speed_mmps)
-        self.lift_position = robot.LiftPosition(height=util.Distance(mm=pkt.lift_height_mm))
         self.battery_voltage = pkt.battery_voltage
-        self.accel = util.Vector3(pkt.accel_x, pkt.accel_y, pkt.accel_z)
-        self.gyro = util.Vector3(pkt.gyro_x, pkt.gyro_y, pkt.gyro_z)
+        self._raw_robot_state = _RawRobotState._make(_get_raw_robot_state(pkt))
         old_status = self.robot_status
         self.robot_status = pkt.status
-        self.dispatch(event.EvtRobotStateUpdated, self)
+        if self.has_handlers(event.EvtRobotStateUpdated):
+            self.dispatch(event.EvtRobotStateUpdated, self)
         # Dispatch status flag change events.
-        for flag, evt in event.STATUS_EVENTS.items():
-            if (old_status & flag) != (pkt.status & flag):
-                state = (pkt.status & flag) != 0
-                logger.debug("%s: %i", robot.RobotStatusFlagNames[flag], state)
-                self.dispatch(evt, self, state)
+        changed = old_status ^ pkt.status
+        if changed:
+            new_status = pkt.status
+            debug = logger.isEnabledFor(logging.DEBUG)
+            for flag, evt in _STATUS_EVTS_TUPLE:
+                if changed & flag:
+                    state = (new_status & flag) != 0
+                    if debug:
+                        logger.debug("%s: %i", _STATUS_FLAG_NAMES[flag], state)
+                    self.dispatch(evt, self, state)
         # Orientation
         if pkt.pose_angle_rad < -0.4:
             robot_orientation = robot.RobotOrientation.ON_LEFT_SIDE
@@ -311,6 +454,102 @@ class Client(event.Dispatcher):
         if self.robot_orientation != robot_orientation:
             self.robot_orientation = robot_orientation
             self.dispatch(event.EvtRobotOrientationChange, self, robot_orientation)
+        # Initialization
+        if self._robot_ready_pending and ((pkt.status & _CALIBRATED_STATUS) == _CALIBRATED_STATUS or
+                                          pkt.timestamp >= self.ROBOT_READY_TIMEOUT_MS):
+            self._robot_ready_pending = False
+            self.anim_controller.start()
+            self.robot_ready = True
+            self.dispatch(event.EvtRobotReady, self)
+
+    def _robot_state_wrappers(self, raw: _RawRobotState) -> dict:
+        """ Returns the wrapper object cache for the given raw robot state, starting a new one if it is outdated. """
+        cache_raw, wrappers = self._robot_state_cache
+        if cache_raw is not raw:
+            wrappers = {}
+            self._robot_state_cache = (raw, wrappers)
+        return wrappers
+
+    @property
+    def pose(self) -> util.Pose:
+        raw = self._raw_robot_state
+        wrappers = self._robot_state_wrappers(raw)
+        pose = wrappers.get("pose")
+        if pose is None:
+            pose = util.Pose(raw.pose_x, raw.pose_y, raw.pose_z, angle_z=util.Angle(radians=raw.pose_angle_rad),
+                             origin_id=raw.pose_origin_id)
+            wrappers["pose"] = pose
+        return pose
+
+    @property
+    def pose_pitch(self) -> util.Angle:
+        raw = self._raw_robot_state
+        wrappers = self._robot_state_wrappers(raw)
+        pose_pitch = wrappers.get("pose_pitch")
+        if pose_pitch is None:
+            pose_pitch = util.Angle(radians=raw.pose_pitch_rad)
+            wrappers["pose_pitch"] = pose_pitch
+        return pose_pitch
+
+    @property
+    def head_angle(self) -> util.Angle:
+        raw = self._raw_robot_state
+        wrappers = self._robot_state_wrappers(raw)
+        head_angle = wrappers.get("head_angle")
+        if head_angle is None:
+            head_angle = util.Angle(radians=raw.head_angle_rad)
+            wrappers["head_angle"] = head_angle
+        return head_angle
+
+    @property
+    def left_wheel_speed(self) -> util.Speed:
+        raw = self._raw_robot_state
+        wrappers = self._robot_state_wrappers(raw)
+        left_wheel_speed = wrappers.get("left_wheel_speed")
+        if left_wheel_speed is None:
+            left_wheel_speed = util.Speed(mmps=raw.lwheel_speed_mmps)
+            wrappers["left_wheel_speed"] = left_wheel_speed
+        return left_wheel_speed
+
+    @property
+    def right_wheel_speed(self) -> util.Speed:
+        raw = self._raw_robot_state
+        wrappers = self._robot_state_wrappers(raw)
+        right_wheel_speed = wrappers.get("right_wheel_speed")
+        if right_wheel_speed is None:
+            right_wheel_speed = util.Speed(mmps=raw.rwheel_speed_mmps)
+            wrappers["right_wheel_speed"] = right_wheel_speed
+        return right_wheel_speed
+
+    @property
+    def lift_position(self) -> robot.LiftPosition:
+        raw = self._raw_robot_state
+        wrappers = self._robot_state_wrappers(raw)
+        lift_position = wrappers.get("lift_position")
+        if lift_position is None:
+            lift_position = robot.LiftPosition(height=util.Distance(mm=raw.lift_height_mm))
+            wrappers["lift_position"] = lift_position
+        return lift_position
+
+    @property
+    def accel(self) -> util.Vector3:
+        raw = self._raw_robot_state
+        wrappers = self._robot_state_wrappers(raw)
+        accel = wrappers.get("accel")
+        if accel is None:
+            accel = util.Vector3(raw.accel_x, raw.accel_y, raw.accel_z)
+            wrappers["accel"] = accel
+        return accel
+
+    @property
+    def gyro(self) -> util.Vector3:
+        raw = self._raw_robot_state
+        wrappers = self._robot_state_wrappers(raw)
+        gyro = wrappers.get("gyro")
+        if gyro is None:
+            gyro = util.Vector3(raw.gyro_x, raw.gyro_y, raw.gyro_z)
+            wrappers["gyro"] = gyro
+        return gyro
 
     def _on_robot_picked_up(self, cli, state):
         del cli
@@ -337,20 +576,20 @@ class Client(event.Dispatcher):
     def _on_object_available(self, cli, pkt: protocol_encoder.ObjectAvailable):
         del cli
         factory_id = pkt.factory_id
-        object_type = protocol_encoder.ObjectType(pkt.object_type)
-        obj = object.Object(factory_id=factory_id, object_type=object_type)
         if factory_id not in self.available_objects:
+            obj = object.Object(factory_id=factory_id, object_type=pkt.object_type)
             self.available_objects[factory_id] = obj
-            logger.debug("Object of type %s with S/N 0x%08x available.", str(obj.object_type), obj.factory_id)
+            if len(self.available_objects) > self.MAX_AVAILABLE_OBJECTS:
+                # Objects that are still around will be added back on their next advertisement.
+                self.available_objects.popitem(last=False)
+            logger.debug("Object of type %s with S/N 0x%08x available.", obj.object_type, obj.factory_id)
 
     def _on_object_connection_state(self, cli, pkt: protocol_encoder.ObjectConnectionState):
         del cli
         if pkt.connected:
             # Connected
-            self.connected_objects[pkt.object_id] = {
-                "factory_id": pkt.factory_id,
-                "object_type": pkt.object_type,
-            }
+            self.connected_objects[pkt.object_id] = object.Object(
+                factory_id=pkt.factory_id, object_type=pkt.object_type)
         else:
             # Disconnected
             if pkt.object_id in self.connected_objects:
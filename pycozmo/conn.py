@@ -203,6 +203,9 @@ class SendThread(Thread):
 class ReceiveThread(Thread):
     """ Cozmo protocol connection receive thread. """
 
+    # Maximum number of frames to receive between socket readiness checks.
+    MAX_BATCH_SIZE = 32
+
     def __init__(self,
                  sock: socket.socket,
                  send_thread: SendThread,
@@ -239,36 +242,46 @@ class ReceiveThread(Thread):
                 ready = select.select((self.sock,), (), (), 0.5)
                 if not ready[0]:
                     continue
-
-                raw_frame, address = self.sock.recvfrom(self.buffer_size)
-                self.received_bytes += len(raw_frame)
             except Exception as e:
-                self.discarded_frames += 1
-                logger_protocol.error("Failed to receive frame. {}".format(e))
+                logger_protocol.error("Failed to wait for frames. {}".format(e))
                 continue
 
-            try:
-                frame = Frame.from_bytes(raw_frame)
-            except Exception as e:
-                self.discarded_frames += 1
-                logger_protocol.error("Failed to decode frame. {}".format(e))
-                continue
+            # Drain all frames, queued in the socket receive buffer, before waiting again.
+            for _ in range(self.MAX_BATCH_SIZE):
+                try:
+                    raw_frame, address = self.sock.recvfrom(self.buffer_size)
+                    self.received_bytes += len(raw_frame)
+                except BlockingIOError:
+                    break
+                except Exception as e:
+                    self.discarded_frames += 1
+                    logger_protocol.error("Failed to receive frame. {}".format(e))
+                    break
 
-            try:
-                if frame.type == protocol_declaration.FrameType.RESET:
-                    self.handle_reset(address)
-                elif self.sender_address:
-                    if self.sender_address != address:
-                        logger_protocol.debug("Received a UDP datagram from unexpected address {}.".format(address))
-                    elif frame.type == protocol_declaration.FrameType.FIN:
-                        self.handle_fin()
-                    else:
-                        self.handle_frame(frame)
+                self.handle_raw_frame(raw_frame, address)
+
+    def handle_raw_frame(self, raw_frame: bytes, address: Tuple[str, int]) -> None:
+        try:
+            frame = Frame.from_bytes(raw_frame)
+        except Exception as e:
+            self.discarded_frames += 1
+            logger_protocol.error("Failed to decode frame. {}".format(e))
+            return
+
+        try:
+            if frame.type == protocol_declaration.FrameType.RESET:
+                self.handle_reset(address)
+            elif self.sender_address:
+                if self.sender_address != address:
+                    logger_protocol.debug("Received a UDP datagram from unexpected address {}.".format(address))
+                elif frame.type == protocol_declaration.FrameType.FIN:
+                    self.handle_fin()
                 else:
-                    logger_protocol.debug("Got unexpected {} from {}".format(frame.type, address))
-            except Exception as e:
-                logger_protocol.error("Failed to handle frame. {}".format(e))
-                continue
+                    self.handle_frame(frame)
+            else:
+                logger_protocol.debug("Got unexpected {} from {}".format(frame.type, address))
+        except Exception as e:
+            logger_protocol.error("Failed to handle frame. {}".format(e))
 
     def handle_reset(self, address):
         if not self.server:
@@ -348,6 +361,8 @@ class Connection(Thread, event.Dispatcher):
     RUN_INTERVAL = 0.01
     PING_INTERVAL = 0.5
     STATS_INTERVAL = 60.0
+    # Socket receive buffer size, large enough to absorb camera image bursts. May be capped by the OS.
+    RECEIVE_BUFFER_SIZE = 256 * 1024
 
     def __init__(self,
                  robot_addr: Optional[Tuple[str, int]] = None,
@@ -369,6 +384,10 @@ class Connection(Thread, event.Dispatcher):
                 self.packet_id_filter.deny_ids(protocol_encoder.PACKETS_BY_GROUP[i])
         self.state = self.IDLE
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.RECEIVE_BUFFER_SIZE)
+        except OSError as e:
+            logger_protocol.warning("Failed to set socket receive buffer size. {}".format(e))
         if server:
             self.sock.bind(self.robot_addr)
         self.sock.setblocking(False)
@@ -5,7 +5,6 @@ Event declaration and dispatching.
 """
 
 from typing import Callable, Optional
-import collections
 import threading
 
 from . import exception
@@ -195,40 +194,69 @@ class Dispatcher(object):
 
     def __init__(self):
         super().__init__()
-        self.dispatch_children = []
-        self.dispatch_handlers = collections.defaultdict(list)
+        # Handlers and child dispatchers are kept in tuples that are rebuilt on change, so that dispatching can
+        # iterate over them directly, without copying. Rebuilding is serialized by dispatch_lock, so that concurrent
+        # changes from different threads are not lost.
+        self.dispatch_lock = threading.Lock()
+        self.dispatch_children = ()
+        self.dispatch_handlers = {}
+        # Events that have one-shot handlers registered.
+        self.dispatch_one_shot_events = set()
 
     def add_child_dispatcher(self, child):
-        self.dispatch_children.append(child)
+        with self.dispatch_lock:
+            self.dispatch_children += (child, )
 
     def del_child_dispatcher(self, child):
-        try:
-            self.dispatch_children.remove(child)
-        except ValueError:
-            pass
+        with self.dispatch_lock:
+            self.dispatch_children = tuple(_child for _child in self.dispatch_children if _child != child)
 
     def add_handler(self, event, f, one_shot=False):
         handler = Handler(f, one_shot=one_shot)
-        self.dispatch_handlers[event].append(handler)
+        with self.dispatch_lock:
+            self.dispatch_handlers[event] = self.dispatch_handlers.get(event, ()) + (handler, )
+            if one_shot:
+                self.dispatch_one_shot_events.add(event)
         return handler
 
     def del_handler(self, event, handler):
-        for i, _handler in enumerate(self.dispatch_handlers[event]):
-            if _handler == handler:
-                del self.dispatch_handlers[event][i]
-                return
+        with self.dispatch_lock:
+            handlers = self.dispatch_handlers.get(event, ())
+            for i, _handler in enumerate(handlers):
+                if _handler == handler:
+                    self._set_handlers(event, handlers[:i] + handlers[i + 1:])
+                    return
+
+    def _set_handlers(self, event, handlers):
+        # Must be called with dispatch_lock held.
+        if handlers:
+            self.dispatch_handlers[event] = handlers
+        else:
+            self.dispatch_handlers.pop(event, None)
+
+    def has_handlers(self, event) -> bool:
+        """ Returns whether this dispatcher or any of its children has handlers for an event. """
+        if event in self.dispatch_handlers:
+            return True
+        return any(child.has_handlers(event) for child in self.dispatch_children)
 
     def del_all_handlers(self):
-        self.dispatch_handlers = collections.defaultdict(list)
+        with self.dispatch_lock:
+            self.dispatch_handlers = {}
+            self.dispatch_one_shot_events = set()
 
     def dispatch(self, event, *args, **kwargs):
         # Dispatch to handlers.
-        handlers = []
-        for i, handler in enumerate(self.dispatch_handlers[event]):
-            if handler.one_shot:
-                # Delete one-shot handlers prior to actual dispatch
-                del self.dispatch_handlers[event][i]
-            handlers.append(handler)
+        if event in self.dispatch_one_shot_events:
+            # Delete one-shot handlers prior to actual dispatch. Take the snapshot under the lock, so that a one-shot
+            # handler, added or dispatched concurrently, runs exactly once.
+            with self.dispatch_lock:
+                handlers = self.dispatch_handlers.get(event, ())
+                # Strip the handlers before clearing the flag, so that unlocked readers never see the old tuple.
+                self._set_handlers(event, tuple(handler for handler in handlers if not handler.one_shot))
+                self.dispatch_one_shot_events.discard(event)
+        else:
+            handlers = self.dispatch_handlers.get(event, ())
         for handler in handlers:
             handler.f(*args, **kwargs)
         # Dispatch to child dispatchers.
@@ -15,6 +15,8 @@ __all__ = [
 class Object(object):
     """ Object representation. """
 
+    __slots__ = ('factory_id', 'object_type')
+
     def __init__(self, factory_id: int, object_type: protocol_encoder.ObjectType) -> None:
         self.factory_id = factory_id
         self.object_type = object_type
@@ -0,0 +1,48 @@
+
+import io
+import unittest
+
+import numpy as np
+from PIL import Image
+
+from pycozmo import camera
+
+
+class TestMiniToJpeg(unittest.TestCase):
+
+    @staticmethod
+    def _make_minigray(width: int, height: int):
+        """ Builds a miniGrayToJpeg image from a quality 50 grayscale JPEG. """
+        pixels = (np.arange(width * height) % 251).astype(np.uint8).reshape(height, width)
+        f = io.BytesIO()
+        Image.fromarray(pixels, "L").save(f, "JPEG", quality=50)
+        jpeg = f.getvalue()
+        sos = jpeg.index(b"\xff\xda")
+        scan = jpeg[sos + 2 + jpeg[sos + 2] * 256 + jpeg[sos + 3]:-2].replace(b"\xff\x00", b"\xff")
+        mini = b"\x00" + scan
+        mini += b"\xff" * (-len(mini) % 4)
+        return mini, pixels
+
+    def test_minigray_to_jpeg(self):
+        mini, pixels = self._make_minigray(320, 240)
+        data = camera.minigray_to_jpeg(mini, 320, 240)
+        self.assertEqual(b"\xff\xd9", bytes(data[-2:]))
+        im = Image.open(io.BytesIO(data))
+        self.assertEqual("L", im.mode)
+        self.assertEqual((320, 240), im.size)
+        diff = np.abs(np.asarray(im).astype(int) - pixels)
+        self.assertLess(diff.mean(), 8.0)
+
+    def test_minigray_to_jpeg_out(self):
+        mini, _ = self._make_minigray(160, 120)
+        expected = camera.minigray_to_jpeg(mini, 160, 120)
+        out = np.empty(2 * len(mini) + 1024, dtype=np.uint8)
+        data = camera.minigray_to_jpeg(memoryview(mini), 160, 120, out=out)
+        self.assertIs(out, data.base)
+        self.assertEqual(bytes(expected), bytes(data))
+
+    def test_minigray_to_jpeg_out_too_small(self):
+        mini, _ = self._make_minigray(160, 120)
+        out = np.empty(16, dtype=np.uint8)
+        with self.assertRaises(ValueError):
+            camera.minigray_to_jpeg(mini, 160, 120, out=out)
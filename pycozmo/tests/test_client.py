@@ -0,0 +1,264 @@
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import pycozmo
+from pycozmo import protocol_encoder
+from pycozmo.tests import test_camera
+
+
+class TestClientInitialization(unittest.TestCase):
+
+    CALIBRATED_STATUS = pycozmo.robot.RobotStatusFlag.HEAD_IN_POS | pycozmo.robot.RobotStatusFlag.LIFT_IN_POS
+
+    def setUp(self):
+        self.cli = pycozmo.Client()
+        self.cli.conn.send = lambda pkt: None
+        self.order = []
+        anim_controller_start = self.cli.anim_controller.start
+
+        def start():
+            self.order.append("anim_start")
+            anim_controller_start()
+
+        self.cli.anim_controller.start = start
+        self.cli.add_handler(pycozmo.event.EvtRobotFound, lambda cli: self.order.append("found"))
+        self.cli.add_handler(pycozmo.event.EvtRobotReady, lambda cli: self.order.append("ready"))
+
+    def tearDown(self):
+        self.cli.anim_controller.stop()
+
+    def _robot_state(self, status=0, timestamp=0):
+        self.cli._on_robot_state(None, protocol_encoder.RobotState(
+            timestamp=timestamp, status=status, cliff_data_raw=(0, 0, 0, 0)))
+
+    def _wait_for_robot(self):
+        self.cli.wait_for_robot(timeout=2.0)
+        self.order.append("returned")
+
+    def test_wait_for_robot(self):
+        thread = threading.Thread(target=self._wait_for_robot, daemon=True)
+        thread.start()
+        deadline = time.perf_counter() + 2.0
+        while not self.cli.has_handlers(pycozmo.event.EvtRobotFound) or len(
+                self.cli.dispatch_handlers[pycozmo.event.EvtRobotFound]) < 2:
+            self.assertLess(time.perf_counter(), deadline)
+            time.sleep(0.001)
+
+        self.cli._on_body_info(None, protocol_encoder.BodyInfo(serial_number=1, body_hw_version=5, body_color=0))
+        self._robot_state(timestamp=30)
+        self._robot_state(status=pycozmo.robot.RobotStatusFlag.HEAD_IN_POS, timestamp=60)
+        self.assertFalse(self.cli.robot_ready)
+        self._robot_state(status=self.CALIBRATED_STATUS, timestamp=90)
+        thread.join(2.0)
+
+        self.assertTrue(self.cli.robot_ready)
+        self.assertEqual(["found", "anim_start", "ready", "returned"], self.order)
+
+    def test_wait_for_robot_already_ready(self):
+        self.cli._on_body_info(None, protocol_encoder.BodyInfo(serial_number=1, body_hw_version=5, body_color=0))
+        self._robot_state(status=self.CALIBRATED_STATUS)
+        self._wait_for_robot()
+        self.assertEqual(["found", "anim_start", "ready", "returned"], self.order)
+        self.assertEqual(1, len(self.cli.dispatch_handlers[pycozmo.event.EvtRobotReady]))
+
+    def test_robot_ready_fallback(self):
+        self.cli._on_body_info(None, protocol_encoder.BodyInfo(serial_number=1, body_hw_version=5, body_color=0))
+        self._robot_state(timestamp=self.cli.ROBOT_READY_TIMEOUT_MS - 30)
+        self.assertFalse(self.cli.robot_ready)
+        self._robot_state(timestamp=self.cli.ROBOT_READY_TIMEOUT_MS)
+        self.assertTrue(self.cli.robot_ready)
+        self.assertEqual(["found", "anim_start", "ready"], self.order)
+
+    def test_wait_for_robot_timeout(self):
+        self.cli._on_body_info(None, protocol_encoder.BodyInfo(serial_number=1, body_hw_version=5, body_color=0))
+        with self.assertRaises(pycozmo.exception.ConnectionTimeout):
+            self.cli.wait_for_robot(timeout=0.1)
+        self.assertEqual(["found"], self.order)
+
+
+class TestClientRobotState(unittest.TestCase):
+
+    def test_robot_state(self):
+        cli = pycozmo.Client()
+        self.assertAlmostEqual(pycozmo.robot.MIN_HEAD_ANGLE.radians, cli.head_angle.radians)
+        self.assertEqual(1, cli.pose.origin_id)
+        head_angle = cli.head_angle
+        cli._on_robot_state(None, protocol_encoder.RobotState(
+            pose_x=10.0, pose_origin_id=2, head_angle_rad=0.5, lwheel_speed_mmps=20.0, lift_height_mm=50.0,
+            accel_x=1.0, gyro_z=2.0, cliff_data_raw=(0, 0, 0, 0)))
+        self.assertIsNot(head_angle, cli.head_angle)
+        self.assertAlmostEqual(0.5, cli.head_angle.radians)
+        self.assertIs(cli.head_angle, cli.head_angle)
+        self.assertAlmostEqual(10.0, cli.pose.position.x)
+        self.assertEqual(2, cli.pose.origin_id)
+        self.assertAlmostEqual(20.0, cli.left_wheel_speed.mmps)
+        self.assertAlmostEqual(50.0, cli.lift_position.height.mm)
+        self.assertAlmostEqual(1.0, cli.accel.x)
+        self.assertAlmostEqual(2.0, cli.gyro.z)
+
+    def test_robot_state_no_wrappers(self):
+        cli = pycozmo.Client()
+        pkt = protocol_encoder.RobotState(accel_x=1.0, gyro_y=2.0, cliff_data_raw=(0, 0, 0, 0))
+        with mock.patch.object(pycozmo.util, "Vector3", side_effect=AssertionError), \
+                mock.patch.object(pycozmo.util, "Angle", side_effect=AssertionError):
+            cli._on_robot_state(None, pkt)
+        self.assertEqual((1.0, 0.0, 0.0), (cli.accel.x, cli.accel.y, cli.accel.z))
+        self.assertEqual((0.0, 2.0, 0.0), (cli.gyro.x, cli.gyro.y, cli.gyro.z))
+        self.assertIs(cli.accel, cli.accel)
+
+    def test_robot_state_stale_wrapper(self):
+        cli = pycozmo.Client()
+        raw = cli._raw_robot_state
+        cli._on_robot_state(None, protocol_encoder.RobotState(head_angle_rad=0.5, cliff_data_raw=(0, 0, 0, 0)))
+        # A reader that fetched the raw state before the packet caches its wrapper against the old values only.
+        cli._robot_state_wrappers(raw)["head_angle"] = pycozmo.util.Angle(radians=raw.head_angle_rad)
+        self.assertAlmostEqual(0.5, cli.head_angle.radians)
+
+
+class TestClientImageChunks(unittest.TestCase):
+
+    CHUNK_SIZE = 1024
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mini, _ = test_camera.TestMiniToJpeg._make_minigray(320, 240)
+
+    def setUp(self):
+        self.cli = pycozmo.Client()
+        self.images = []
+        self.cli.add_handler(pycozmo.event.EvtNewRawCameraImage, lambda cli, image: self.images.append(image))
+
+    def tearDown(self):
+        self.assertEqual(3, len(self.cli._free_image_bufs))
+        self.assertIsNone(self.cli._partial_buf)
+
+    def _make_chunks(self, image_id, mini=None,
+                     encoding=protocol_encoder.ImageEncoding.JPEGMinimizedGray,
+                     resolution=protocol_encoder.ImageResolution.QVGA):
+        if mini is None:
+            mini = self.mini
+        chunks = [mini[i:i + self.CHUNK_SIZE] for i in range(0, len(mini), self.CHUNK_SIZE)]
+        return [
+            protocol_encoder.ImageChunk(
+                frame_timestamp=image_id, image_id=image_id, image_encoding=encoding, image_resolution=resolution,
+                image_chunk_count=len(chunks), chunk_id=chunk_id, data=data)
+            for chunk_id, data in enumerate(chunks)]
+
+    @staticmethod
+    def _make_minicolor(width: int, height: int):
+        """ Builds a miniColorToJpeg image of alternating bright and dark vertical stripes, 8 pixels wide. """
+        bits = ""
+        # Color images are half width. Each MCU covers 16x8 pixels.
+        for _ in range((width // 2 // 16) * (height // 8)):
+            # Y blocks: DC differences +15 and -15 (category 4), end of block.
+            bits += "101" "1111" "1010" "101" "0000" "1010"
+            # Cb and Cr blocks: DC difference 0, end of block.
+            bits += "00" "1010" "00" "1010"
+        bits += "1" * (-len(bits) % 8)
+        scan = bytes(int(bits[i:i + 8], 2) for i in range(0, len(bits), 8))
+        mini = b"\x01" + scan
+        mini += b"\xff" * (-len(mini) % 4)
+        return mini
+
+    def _feed(self, chunks):
+        for chunk in chunks:
+            self.cli._on_image_chunk(None, chunk)
+
+    def _process_images(self):
+        """ Runs the image thread until all queued images are decoded. """
+        self.cli.stop_flag = False
+        thread = threading.Thread(target=self.cli._image_thread_run, daemon=True)
+        thread.start()
+        deadline = time.perf_counter() + 2.0
+        while not self.cli._image_queue.empty() or len(self.cli._free_image_bufs) < 3:
+            self.assertLess(time.perf_counter(), deadline)
+            time.sleep(0.001)
+        self.cli.stop_flag = True
+        thread.join()
+
+    def test_complete_image(self):
+        chunks = self._make_chunks(1)
+        self.assertGreater(len(chunks), 2)
+        self._feed(chunks)
+        self._process_images()
+        self.assertEqual(1, len(self.images))
+        self.assertEqual("L", self.images[0].mode)
+        self.assertEqual((320, 240), self.images[0].size)
+        self.assertEqual(1, self.cli.last_image_timestamp)
+
+    def test_gray_buffer_size(self):
+        chunks = self._make_chunks(1)
+        self._feed(chunks[:1])
+        self.assertEqual(320 * 240, len(self.cli._partial_buf))
+        self._feed(chunks[1:])
+        self._process_images()
+        self.assertEqual(1, len(self.images))
+
+    def test_image_too_large(self):
+        self._feed(self._make_chunks(1, resolution=protocol_encoder.ImageResolution.VerificationSnapshot))
+        self._process_images()
+        self.assertEqual([], self.images)
+
+    def test_color_image(self):
+        self._feed(self._make_chunks(1, mini=self._make_minicolor(320, 240)))
+        self._process_images()
+        self.assertEqual(1, len(self.images))
+        self.assertEqual("RGB", self.images[0].mode)
+        self.assertEqual((320, 240), self.images[0].size)
+        pixels = np.asarray(self.images[0])
+        # Pixel doubled columns.
+        np.testing.assert_array_equal(pixels[:, 0::2], pixels[:, 1::2])
+        # 8 pixel wide stripes at half width become 16 pixels wide.
+        self.assertGreater(int(pixels[0, 0, 0]) - int(pixels[0, 16, 0]), 20)
+        np.testing.assert_array_equal(pixels[:, :16], pixels[:, 32:48])
+
+    def test_color_image_bilinear(self):
+        self.cli.fast_color_resize = False
+        self._feed(self._make_chunks(1, mini=self._make_minicolor(320, 240)))
+        self._process_images()
+        self.assertEqual(1, len(self.images))
+        self.assertEqual("RGB", self.images[0].mode)
+        self.assertEqual((320, 240), self.images[0].size)
+        pixels = np.asarray(self.images[0])
+        # Interpolated columns at stripe edges.
+        self.assertFalse(np.array_equal(pixels[:, 0::2], pixels[:, 1::2]))
+
+    def test_missing_chunk(self):
+        chunks = self._make_chunks(1)
+        del chunks[1]
+        self._feed(chunks)
+        self._process_images()
+        self.assertEqual([], self.images)
+
+    def test_new_image_mid_image(self):
+        self._feed(self._make_chunks(1)[:2])
+        self._feed(self._make_chunks(2))
+        self._process_images()
+        self.assertEqual(1, len(self.images))
+        self.assertEqual(2, self.cli.last_image_timestamp)
+
+    def test_queue_overflow(self):
+        for image_id in range(1, 6):
+            self._feed(self._make_chunks(image_id))
+        self.assertEqual(1, self.cli._image_queue.qsize())
+        self._process_images()
+        self.assertEqual(1, len(self.images))
+        self.assertEqual(5, self.cli.last_image_timestamp)
+
+
+class TestClientObjects(unittest.TestCase):
+
+    def test_available_objects_cap(self):
+        cli = pycozmo.Client()
+        for factory_id in range(1, cli.MAX_AVAILABLE_OBJECTS + 2):
+            cli._on_object_available(None, protocol_encoder.ObjectAvailable(factory_id=factory_id))
+        self.assertEqual(cli.MAX_AVAILABLE_OBJECTS, len(cli.available_objects))
+        self.assertNotIn(1, cli.available_objects)
+        self.assertIn(2, cli.available_objects)
+        self.assertIn(cli.MAX_AVAILABLE_OBJECTS + 1, cli.available_objects)
+        self.assertEqual(2, next(iter(cli.available_objects)))
@@ -1,6 +1,10 @@
 
+import select
+import socket
+import time
 import unittest
 from threading import Event
+from unittest import mock
 
 import pycozmo
 
@@ -65,3 +69,58 @@ class TestConnection(unittest.TestCase):
         self.assertTrue(self.s_e.wait(5.0))
         self.assertEqual(counts, list(range(COUNT)))
         self.stop()
+
+
+class TestReceiveThread(unittest.TestCase):
+
+    def setUp(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.setblocking(False)
+        self.sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sender.bind(("127.0.0.1", 0))
+        self.pkts = []
+        self.recv_thread = pycozmo.conn.ReceiveThread(
+            self.sock, mock.Mock(), self.sender.getsockname(), self.pkts.append)
+
+    def tearDown(self):
+        self.recv_thread.stop()
+        self.sender.close()
+        self.sock.close()
+
+    def _send_frame(self, factory_id):
+        frame = pycozmo.frame.Frame(
+            pycozmo.protocol_ast.FrameType.ROBOT, pycozmo.protocol_declaration.OOB_SEQ,
+            pycozmo.protocol_declaration.OOB_SEQ, 0, [pycozmo.protocol_encoder.ObjectAvailable(factory_id)])
+        self.sender.sendto(frame.to_bytes(), self.sock.getsockname())
+
+    def _wait_for_pkts(self, count):
+        deadline = time.perf_counter() + 2.0
+        while len(self.pkts) < count:
+            self.assertLess(time.perf_counter(), deadline)
+            time.sleep(0.001)
+
+    def test_batch(self):
+        # Queue frames before the thread starts, so that they are received in a single batch.
+        for i in range(10):
+            self._send_frame(i)
+        with mock.patch.object(pycozmo.conn.select, "select", wraps=select.select) as select_mock:
+            self.recv_thread.start()
+            self._wait_for_pkts(10)
+        # One wait for the batch, and possibly the next one after it.
+        self.assertLessEqual(select_mock.call_count, 2)
+        self.assertEqual(list(range(10)), [pkt.factory_id for pkt in self.pkts])
+        self.assertEqual(10, self.recv_thread.received_frames)
+        self.assertEqual(0, self.recv_thread.discarded_frames)
+
+    def test_batch_undecodable_frame(self):
+        for i in range(3):
+            self._send_frame(i)
+        self.sender.sendto(b"\x00\x01\x02", self.sock.getsockname())
+        for i in range(3, 6):
+            self._send_frame(i)
+        self.recv_thread.start()
+        self._wait_for_pkts(6)
+        self.assertEqual(list(range(6)), [pkt.factory_id for pkt in self.pkts])
+        self.assertEqual(6, self.recv_thread.received_frames)
+        self.assertEqual(1, self.recv_thread.discarded_frames)
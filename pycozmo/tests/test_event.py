@@ -0,0 +1,109 @@
+
+import threading
+import unittest
+
+from pycozmo.event import Dispatcher, EvtRobotStateUpdated, EvtRobotReady
+
+
+class TestDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.d = Dispatcher()
+        self.child = Dispatcher()
+        self.d.add_child_dispatcher(self.child)
+
+    def test_has_handlers_empty(self):
+        self.assertFalse(self.d.has_handlers(EvtRobotStateUpdated))
+
+    def test_has_handlers(self):
+        handler = self.d.add_handler(EvtRobotStateUpdated, lambda: None)
+        self.assertTrue(self.d.has_handlers(EvtRobotStateUpdated))
+        self.assertFalse(self.d.has_handlers(EvtRobotReady))
+        self.d.del_handler(EvtRobotStateUpdated, handler)
+        self.assertFalse(self.d.has_handlers(EvtRobotStateUpdated))
+
+    def test_has_handlers_child(self):
+        self.child.add_handler(EvtRobotStateUpdated, lambda: None)
+        self.assertTrue(self.d.has_handlers(EvtRobotStateUpdated))
+        self.assertFalse(self.child.has_handlers(EvtRobotReady))
+
+    def test_has_handlers_one_shot(self):
+        calls = []
+        self.d.add_handler(EvtRobotStateUpdated, lambda: calls.append(1), one_shot=True)
+        self.assertTrue(self.d.has_handlers(EvtRobotStateUpdated))
+        self.d.dispatch(EvtRobotStateUpdated)
+        self.assertEqual([1], calls)
+        self.assertFalse(self.d.has_handlers(EvtRobotStateUpdated))
+
+    def test_dispatch_order(self):
+        calls = []
+        self.d.add_handler(EvtRobotStateUpdated, lambda x: calls.append(("a", x)))
+        self.d.add_handler(EvtRobotStateUpdated, lambda x: calls.append(("b", x)))
+        self.child.add_handler(EvtRobotStateUpdated, lambda x: calls.append(("c", x)))
+        self.d.dispatch(EvtRobotStateUpdated, 1)
+        self.assertEqual([("a", 1), ("b", 1), ("c", 1)], calls)
+
+    def test_dispatch_one_shot_mixed(self):
+        calls = []
+        self.d.add_handler(EvtRobotStateUpdated, lambda: calls.append("a"))
+        self.d.add_handler(EvtRobotStateUpdated, lambda: calls.append("b"), one_shot=True)
+        self.d.dispatch(EvtRobotStateUpdated)
+        self.d.dispatch(EvtRobotStateUpdated)
+        self.assertEqual(["a", "b", "a"], calls)
+
+    def test_del_child_dispatcher(self):
+        calls = []
+        self.child.add_handler(EvtRobotStateUpdated, lambda: calls.append(1))
+        self.d.del_child_dispatcher(self.child)
+        self.d.del_child_dispatcher(self.child)
+        self.d.dispatch(EvtRobotStateUpdated)
+        self.assertEqual([], calls)
+        self.assertFalse(self.d.has_handlers(EvtRobotStateUpdated))
+
+    def test_del_all_handlers(self):
+        self.d.add_handler(EvtRobotStateUpdated, lambda: None)
+        self.d.add_handler(EvtRobotReady, lambda: None, one_shot=True)
+        self.d.del_all_handlers()
+        self.assertFalse(self.d.has_handlers(EvtRobotStateUpdated))
+        self.assertFalse(self.d.has_handlers(EvtRobotReady))
+
+    def test_add_handler_concurrent(self):
+        def add_handlers():
+            for _ in range(1000):
+                self.d.add_handler(EvtRobotStateUpdated, lambda: None)
+                self.d.add_handler(EvtRobotReady, lambda: None, one_shot=True)
+
+        threads = [threading.Thread(target=add_handlers) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for _ in range(100):
+            self.d.dispatch(EvtRobotReady)
+        for thread in threads:
+            thread.join()
+        self.assertEqual(4000, len(self.d.dispatch_handlers[EvtRobotStateUpdated]))
+
+    def test_dispatch_one_shot_concurrent(self):
+        calls = []
+        paused = threading.Event()
+        resume = threading.Event()
+        first = threading.Thread(target=self.d.dispatch, args=(EvtRobotReady, ))
+
+        class PausingDict(dict):
+            def get(self, key, default=None):
+                value = super().get(key, default)
+                if threading.current_thread() is first:
+                    # Let the second dispatch run in between, if it can.
+                    paused.set()
+                    resume.wait(0.2)
+                return value
+
+        self.d.dispatch_handlers = PausingDict()
+        self.d.add_handler(EvtRobotReady, lambda: calls.append(1), one_shot=True)
+        first.start()
+        paused.wait(1.0)
+        second = threading.Thread(target=lambda: (self.d.dispatch(EvtRobotReady), resume.set()))
+        second.start()
+        first.join()
+        second.join()
+        self.assertEqual([1], calls)
+        self.assertFalse(self.d.has_handlers(EvtRobotReady))